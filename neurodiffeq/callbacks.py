@@ -563,6 +563,9 @@ class _RepeatedMetricChange(ConditionCallback):
 
     def condition(self, solver) -> bool:
         history = solver.metrics_history[self.key]
+        # values repeated on skipped validation epochs (see `valid_every` in `BaseSolver.fit`) leave the count unchanged
+        if self.key.startswith('valid_') and len(history) - 1 in getattr(solver, '_skipped_valid_epochs', ()):
+            return self.so_far >= self.times_required
         if len(history) >= 2 and self._last_satisfied(last=history[-1], second2last=history[-2]):
             self.so_far += 1
         else:
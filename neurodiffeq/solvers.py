@@ -1,12 +1,18 @@
 import torch
 import warnings
+import contextlib
 import torch.nn as nn
+import torch.distributed as dist
 from inspect import signature
 from abc import ABC, abstractmethod
 from itertools import chain
 from copy import deepcopy
 from torch.optim import Adam
 from neurodiffeq.networks import FCNN
+from neurodiffeq.conditions import BaseCondition
+from neurodiffeq.conditions import NoCondition
+from neurodiffeq.conditions import IVP
+from neurodiffeq.conditions import DirichletBVP
 from neurodiffeq._version_utils import deprecated_alias
 from neurodiffeq.generators import GeneratorSpherical
 from neurodiffeq.generators import SamplerGenerator
@@ -15,6 +21,40 @@ from neurodiffeq.generators import Generator2D
 from neurodiffeq.function_basis import RealSphericalHarmonics
 
 
+def _script_or_eager(net):
+    r"""Compile a network with ``torch.jit.script``; return the network itself if it cannot be scripted."""
+    try:
+        return torch.jit.script(net)
+    except Exception as e:
+        warnings.warn(f"Failed to script {net.__class__.__name__}, using it in eager mode instead: {e}")
+        return net
+
+
+# attributes of conditions whose parameterization can be vectorized across output units of a network
+_STACKABLE_CONDITION_ATTRIBUTES = {
+    NoCondition: (),
+    IVP: ('t_0', 'u_0', 'u_0_prime'),
+    DirichletBVP: ('t_0', 'u_0', 't_1', 'u_1'),
+}
+
+
+def _stackable_conditions(nets, conditions):
+    r"""Whether ``conditions`` are imposed, in order, on the output units of a single network,
+    and are all of the same class whose parameterization can be vectorized (see ``_STACKABLE_CONDITION_ATTRIBUTES``).
+    """
+    cls = conditions[0].__class__ if conditions else None
+    if cls not in _STACKABLE_CONDITION_ATTRIBUTES:
+        return False
+    if any(net is not nets[0] for net in nets):
+        return False
+    if any(c.__class__ is not cls or c.ith_unit != i for i, c in enumerate(conditions)):
+        return False
+    # Dirichlet and Neumann IVPs are parameterized differently
+    if cls is IVP and len(set(c.u_0_prime is None for c in conditions)) > 1:
+        return False
+    return True
+
+
 class BaseSolver(ABC):
     r"""A class for solving ODE/PDE systems.
 
@@ -71,6 +111,28 @@ class BaseSolver(ABC):
     :param n_output_units:
         Number of output units for each neural network. Ignored if ``nets`` is specified.
     :type n_output_units: int, required
+    :param distributed:
+        Whether to train with data parallelism across all processes of the default ``torch.distributed`` group,
+        which must be initialized beforehand (e.g. with ``torch.distributed.init_process_group``).
+        Each process samples its own batches, so generators should be randomized differently on each process.
+        Gradients and reported losses are averaged across processes.
+        Defaults to False.
+    :type distributed: bool, optional
+    :param jit:
+        Whether to compile the networks with ``torch.jit.script`` for training.
+        The compiled networks share parameters with ``nets``, which are still used for monitoring and solutions.
+        Networks that cannot be scripted are used as they are, with a warning.
+        Defaults to False.
+    :type jit: bool, optional
+    :param precision:
+        Precision of the forward pass during training and validation; one of 'fp32', 'bf16', or 'fp16'.
+        With 'bf16' or 'fp16', the networks and residuals are computed under ``torch.autocast``
+        (which only affects float32 tensors, see ``neurodiffeq.utils.set_tensor_type``);
+        with 'fp16', gradients are also scaled with a ``torch.amp.GradScaler``,
+        which doesn't support optimizers that require a closure (e.g. ``torch.optim.LBFGS``).
+        With 'fp32', an autocast region entered by the caller is left in effect.
+        Defaults to 'fp32'.
+    :type precision: str, optional
     :param batch_size:
         **[DEPRECATED and IGNORED]**
         Each batch will use all samples generated.
@@ -85,7 +147,7 @@ class BaseSolver(ABC):
     def __init__(self, diff_eqs, conditions,
                  nets=None, train_generator=None, valid_generator=None, analytic_solutions=None,
                  optimizer=None, criterion=None, n_batches_train=1, n_batches_valid=4,
-                 metrics=None, n_input_units=None, n_output_units=None,
+                 metrics=None, n_input_units=None, n_output_units=None, distributed=False, jit=False, precision='fp32',
                  # deprecated arguments are listed below
                  shuffle=None, batch_size=None):
         # deprecate argument `shuffle`
@@ -112,6 +174,13 @@ class BaseSolver(ABC):
         else:
             self.nets = nets
 
+        self.jit = jit
+        # scripted networks, keyed by id of the original networks in `self.nets`, see `_forward_nets`
+        self._scripted_nets = {}
+        if self.jit:
+            # script networks upfront, so that failures are reported on construction
+            self._forward_nets
+
         if train_generator is None:
             raise ValueError("train_generator must be specified")
 
@@ -149,13 +218,64 @@ class BaseSolver(ABC):
         self.metrics_history.update({'train_loss': [], 'valid_loss': []})
         self.metrics_history.update({'train__' + name: [] for name in self.metrics_fn})
         self.metrics_history.update({'valid__' + name: [] for name in self.metrics_fn})
-
-        self.optimizer = optimizer if optimizer else Adam(chain.from_iterable(n.parameters() for n in self.nets))
+        # indices of validation history where validation was skipped and the latest values were repeated, see `fit`
+        self._skipped_valid_epochs = set()
+
+        self.distributed = distributed
+        if self.distributed:
+            if not (dist.is_available() and dist.is_initialized()):
+                raise ValueError("distributed=True requires an initialized torch.distributed process group")
+            # start from identical parameters on every process
+            for net in {id(n): n for n in self.nets}.values():
+                for tensor in net.state_dict().values():
+                    dist.broadcast(tensor, src=0)
+
+        autocast_dtypes = {'fp32': None, 'bf16': torch.bfloat16, 'fp16': torch.float16}
+        if precision not in autocast_dtypes:
+            raise ValueError(f"Unknown precision '{precision}'; precision must be 'fp32', 'bf16', or 'fp16'")
+        self.precision = precision
+        self._autocast_dtype = autocast_dtypes[precision]
+        # autocast and gradient scaling are done on the device where the networks live
+        first_param = next(chain.from_iterable(n.parameters() for n in self.nets), None)
+        self._device_type = first_param.device.type if first_param is not None else 'cpu'
+        self._grad_scaler = torch.amp.GradScaler(self._device_type) if precision == 'fp16' else None
+
+        if optimizer is None:
+            # the same network can be repeated in `nets` (e.g. a single multi-output network), deduplicate parameters
+            parameters = {id(p): p for p in chain.from_iterable(n.parameters() for n in self.nets)}
+            # use the fused (CUDA) or multi-tensor implementation of Adam if supported by the installed PyTorch
+            adam_options = {}
+            if self._device_type == 'cuda' and 'fused' in signature(Adam).parameters:
+                adam_options['fused'] = True
+            elif 'foreach' in signature(Adam).parameters:
+                adam_options['foreach'] = True
+            optimizer = Adam(parameters.values(), **adam_options)
+        self.optimizer = optimizer
+        if self._grad_scaler is not None:
+            closure_param = signature(self.optimizer.step).parameters.get('closure')
+            if closure_param is not None and closure_param.default is closure_param.empty:
+                raise ValueError(
+                    f"precision='fp16' doesn't support {self.optimizer.__class__.__name__}, "
+                    f"whose `step` requires a closure; use precision='bf16' or 'fp32' instead"
+                )
 
         if criterion is None:
             self.criterion = lambda r: (r ** 2).mean()
+        elif isinstance(criterion, nn.MSELoss) and criterion.reduction == 'mean':
+            # equivalent to `criterion(r, torch.zeros_like(r))` without allocating a tensor of zeros
+            self.criterion = lambda r: (r ** 2).mean()
         elif isinstance(criterion, nn.modules.loss._Loss):
-            self.criterion = lambda r: criterion(r, torch.zeros_like(r))
+            zeros = {}
+
+            def zero_target_criterion(r):
+                # reuse the target tensor of zeros as long as residuals keep the same shape, dtype, and device
+                key = (r.shape, r.dtype, r.device)
+                if key not in zeros:
+                    zeros.clear()
+                    zeros[key] = torch.zeros_like(r)
+                return criterion(r, zeros[key])
+
+            self.criterion = zero_target_criterion
         else:
             self.criterion = criterion
 
@@ -170,8 +290,10 @@ class BaseSolver(ABC):
         self.n_batches = make_pair_dict(train=n_batches_train, valid=n_batches_valid)
         # current batch of samples, kept for additional_loss term to use
         self._batch_examples = make_pair_dict()
-        # current network with lowest loss
+        # current network with lowest loss, a copy of `self.nets` whose parameters are updated in place
         self.best_nets = None
+        # networks `self.best_nets` were copied from, used to detect reassignment of `self.nets`
+        self._best_nets_source = None
         # current lowest loss
         self.lowest_loss = None
         # local epoch in a `.fit` call, should only be modified inside self.fit()
@@ -193,6 +315,36 @@ class BaseSolver(ABC):
         """
         return len(self.metrics_history['train_loss'])
 
+    @property
+    def _forward_nets(self):
+        r"""Networks used for the forward pass during training, sharing parameters with ``self.nets``.
+        If ``self.jit`` is set, these are the scripted networks, which are (re-)compiled whenever ``self.nets`` changes.
+
+        :rtype: list[torch.nn.Module]
+        """
+        if not self.jit:
+            return self.nets
+        scripted = {}
+        for net in self.nets:
+            if id(net) in scripted:
+                continue
+            cached = self._scripted_nets.get(id(net))
+            # the original network is kept alongside, ids can be reused once a network is garbage collected
+            scripted[id(net)] = cached if cached is not None and cached[0] is net else (net, _script_or_eager(net))
+        self._scripted_nets = scripted
+        return [scripted[id(net)][1] for net in self.nets]
+
+    @property
+    def _stacked(self):
+        r"""Whether all conditions can be enforced at once on the output of a single network, see ``_compute_funcs``.
+
+        :rtype: bool
+        """
+        return (
+            self.__class__.compute_func_val is BaseSolver.compute_func_val
+            and _stackable_conditions(self.nets, self.conditions)
+        )
+
     def compute_func_val(self, net, cond, *coordinates):
         r"""Compute the function value evaluated on the points specified by ``coordinates``.
 
@@ -207,6 +359,72 @@ class BaseSolver(ABC):
         """
         return cond.enforce(net, *coordinates)
 
+    def _compute_funcs(self, coordinates):
+        r"""Compute the values of all target functions evaluated on the points specified by ``coordinates``.
+
+        When several conditions are imposed on different output units of the same network
+        (see ``BaseCondition.set_impose_on``), the network is only evaluated once.
+        If, in addition, all conditions are of the same simple class (e.g. ``IVP``),
+        they are enforced on all output units at once.
+
+        :param coordinates: A tuple of coordinate components, each with shape = (-1, 1).
+        :type coordinates: tuple[torch.Tensor]
+        :return: Function values at the sampled points, one for each condition.
+        :rtype: list[torch.Tensor]
+        """
+        if self._stacked:
+            output = self._forward_nets[0](torch.cat(coordinates, dim=1))[:, :self.n_funcs]
+            return list(self._stacked_parameterize(output, *coordinates).split(1, dim=1))
+
+        # subclasses overriding `compute_func_val` (e.g. to use a custom enforcer) always take the slow path
+        shareable = self.__class__.compute_func_val is BaseSolver.compute_func_val
+        outputs = {}
+        funcs = []
+        for net, cond in zip(self._forward_nets, self.conditions):
+            if not shareable or cond.ith_unit is None or cond.__class__.enforce is not BaseCondition.enforce:
+                funcs.append(self.compute_func_val(net, cond, *coordinates))
+                continue
+            if id(net) not in outputs:
+                outputs[id(net)] = net(torch.cat(coordinates, dim=1))
+            funcs.append(cond.parameterize(outputs[id(net)][:, cond.ith_unit].view(-1, 1), *coordinates))
+        return funcs
+
+    def _stacked_parameterize(self, output_tensor, *input_tensors):
+        r"""Re-parameterize all output units of a network at once, the i-th unit by the i-th condition.
+        Equivalent to ``torch.cat([c.parameterize(output_tensor[:, i:i+1], *input_tensors) for ...], dim=1)``.
+
+        :param output_tensor: Output of the network, with as many units (.shape[1]) as there are conditions.
+        :type output_tensor: torch.Tensor
+        :param input_tensors: Inputs to the network, each with shape = (-1, 1).
+        :type input_tensors: torch.Tensor
+        :return: The re-parameterized output of the network.
+        :rtype: torch.Tensor
+        """
+        cls = self.conditions[0].__class__
+        if cls is NoCondition:
+            return output_tensor
+
+        t, = input_tensors
+        # condition attributes as row vectors, rebuilt on every call in case conditions are modified;
+        # they follow the dtype of inputs, since outputs can be in reduced precision under autocast
+        a = {
+            name: t.new_tensor([[getattr(c, name) for c in self.conditions]])
+            for name in _STACKABLE_CONDITION_ATTRIBUTES[cls]
+            if getattr(self.conditions[0], name) is not None
+        }
+
+        if cls is IVP:
+            if 'u_0_prime' not in a:
+                return a['u_0'] + (1 - torch.exp(-t + a['t_0'])) * output_tensor
+            else:
+                return a['u_0'] + (t - a['t_0']) * a['u_0_prime'] \
+                       + ((1 - torch.exp(-t + a['t_0'])) ** 2) * output_tensor
+        else:  # DirichletBVP
+            t_tilde = (t - a['t_0']) / (a['t_1'] - a['t_0'])
+            return a['u_0'] * (1 - t_tilde) \
+                   + a['u_1'] * t_tilde \
+                   + (1 - torch.exp((1 - t_tilde) * t_tilde)) * output_tensor
+
     def _update_history(self, value, metric_type, key):
         r"""Append a value to corresponding history list.
 
@@ -246,7 +464,8 @@ class BaseSolver(ABC):
         # the following side effects are helpful for future extension,
         # especially for additional loss term that depends on the coordinates
         self._phase = key
-        self._batch_examples[key] = [v.reshape(-1, 1) for v in self.generator[key].get_examples()]
+        # `SamplerGenerator` already returns tensors of shape (-1, 1), no need to reshape them again
+        self._batch_examples[key] = self.generator[key].get_examples()
         return self._batch_examples[key]
 
     def _generate_train_batch(self):
@@ -257,17 +476,56 @@ class BaseSolver(ABC):
         r"""Generate the next validation batch, register in ``self._batch_examples`` and return."""
         return self._generate_batch('valid')
 
+    def _average_gradients(self):
+        r"""Average gradients of all optimized parameters across processes. Only used when ``self.distributed``."""
+        world_size = dist.get_world_size()
+        for group in self.optimizer.param_groups:
+            for p in group['params']:
+                if p.grad is not None:
+                    dist.all_reduce(p.grad)
+                    p.grad /= world_size
+
+    def _average_across_processes(self, value):
+        r"""Average a tensor across processes if ``self.distributed``, otherwise return it as is."""
+        if not self.distributed:
+            return value
+        value = value.clone()
+        dist.all_reduce(value)
+        return value / dist.get_world_size()
+
+    def _autocast(self):
+        r"""Context manager for the forward pass; enables ``torch.autocast`` unless ``self.precision`` is 'fp32'."""
+        if self._autocast_dtype is None:
+            return contextlib.nullcontext()
+        return torch.autocast(self._device_type, dtype=self._autocast_dtype)
+
     def _do_optimizer_step(self, closure=None):
         r"""Optimization procedures after gradients have been computed. Usually ``self.optimizer.step()`` is sufficient.
         At times, users can overwrite this method to perform gradient clipping, etc. Here is an example::
 
             import itertools
-            class MySolver(Solver)
-                def _do_optimizer_step(self):
-                    nn.utils.clip_grad_norm_(itertools.chain([net.parameters() for net in self.nets]), 1.0, 'inf')
+            class MySolver(Solver1D):
+                def _do_optimizer_step(self, closure=None):
+                    closure()  # computes the loss and its gradients
+                    params = itertools.chain.from_iterable(net.parameters() for net in self.nets)
+                    nn.utils.clip_grad_norm_(params, 1.0, 'inf')
                     self.optimizer.step()
+
+        :param closure: A closure that computes the loss and its gradients w.r.t. the parameters.
+        :type closure: callable
+
+        .. note::
+            With ``precision='fp16'``, gradients are scaled by ``self._grad_scaler``;
+            an overriding method must call ``self._grad_scaler.unscale_(self.optimizer)`` before clipping,
+            and step with ``self._grad_scaler.step(self.optimizer)`` followed by ``self._grad_scaler.update()``.
         """
-        self.optimizer.step(closure)
+        if self._grad_scaler is None:
+            self.optimizer.step(closure)
+        else:
+            # GradScaler doesn't support closures, the closure is called once to compute (scaled) gradients
+            closure()
+            self._grad_scaler.step(self.optimizer)
+            self._grad_scaler.update()
 
     def _run_epoch(self, key):
         r"""Run an epoch on train/valid points, update history, and perform an optimization step if key=='train'.
@@ -279,6 +537,7 @@ class BaseSolver(ABC):
             The optimization step is only performed after all batches are run.
         """
         self._phase = key
+        # losses and metrics are accumulated as detached tensors and synchronized only once at the end of the epoch
         epoch_loss = 0.0
         batch_loss = 0.0
         metric_values = {name: 0.0 for name in self.metrics_fn}
@@ -291,39 +550,53 @@ class BaseSolver(ABC):
             def closure():
                 nonlocal batch_loss
                 if key == 'train':
-                    self.optimizer.zero_grad()
-                funcs = [
-                    self.compute_func_val(n, c, *batch) for n, c in zip(self.nets, self.conditions)
-                ]
+                    self.optimizer.zero_grad(set_to_none=True)
+                with self._autocast():
+                    funcs = self._compute_funcs(batch)
+                    residuals = self.diff_eqs(*funcs, *batch)
+                    residuals = torch.cat(residuals, dim=1)
 
                 for name in self.metrics_fn:
-                    value = self.metrics_fn[name](*funcs, *batch).item()
+                    value = self.metrics_fn[name](*funcs, *batch).detach().reshape(())
                     metric_values[name] += value
-                residuals = self.diff_eqs(*funcs, *batch)
-                residuals = torch.cat(residuals, dim=1)
+                # reduced-precision residuals are promoted so that the loss is computed in (at least) float32
+                if residuals.dtype in (torch.float16, torch.bfloat16):
+                    residuals = residuals.float()
                 loss = self.criterion(residuals) + self.additional_loss(funcs, key)
 
                 # accumulate gradients before the current graph is collected as garbage
                 if key == 'train':
-                    loss.backward()
-                    batch_loss = loss.item()
+                    if self._grad_scaler is None:
+                        loss.backward()
+                    else:
+                        self._grad_scaler.scale(loss).backward()
+                    if self.distributed:
+                        self._average_gradients()
+                        # optimizers may call the closure depending on the loss (e.g. LBFGS),
+                        # all processes must see the same value to perform the same collective operations
+                        loss = self._average_across_processes(loss.detach())
+                    batch_loss = loss.detach()
                 return loss
             if key == 'train':
                 self._do_optimizer_step(closure=closure)
                 epoch_loss += batch_loss
             else:
-                epoch_loss += closure().item()
+                epoch_loss += closure().detach()
+
+        # calculate mean loss and metrics of all batches with a single device-to-host copy
+        values = torch.stack([epoch_loss] + [metric_values[name] for name in self.metrics_fn]).to(torch.float64)
+        values = self._average_across_processes(values) / self.n_batches[key]
+        epoch_loss, *metric_means = values.tolist()
 
-        # calculate mean loss of all batches and register to history
-        self._update_history(epoch_loss / self.n_batches[key], 'loss', key)
+        # register mean loss to history
+        self._update_history(epoch_loss, 'loss', key)
 
         if key == 'valid':
             self._update_best()
 
-        # calculate average metrics across batches and register to history
-        for name in self.metrics_fn:
-            self._update_history(
-                metric_values[name] / self.n_batches[key], name, key)
+        # register average metrics to history
+        for name, value in zip(self.metrics_fn, metric_means):
+            self._update_history(value, name, key)
 
     def run_train_epoch(self):
         r"""Run a training epoch, update history, and perform gradient descent."""
@@ -333,16 +606,42 @@ class BaseSolver(ABC):
         r"""Run a validation epoch and update history."""
         self._run_epoch('valid')
 
+    def _skip_valid_epoch(self):
+        r"""Skip a validation epoch by repeating the latest validation loss and metrics in history."""
+        self._skipped_valid_epochs.add(len(self.metrics_history['valid_loss']))
+        self._update_history(self.metrics_history['valid_loss'][-1], 'loss', 'valid')
+        for name in self.metrics_fn:
+            self._update_history(self.metrics_history['valid__' + name][-1], name, 'valid')
+
     def _update_best(self):
         r"""Update ``self.lowest_loss`` and ``self.best_nets``
         if current validation loss is lower than ``self.lowest_loss``
+
+        .. note::
+            After they are first created, ``self.best_nets`` are updated in place (with ``load_state_dict``);
+            references to them, e.g. solutions returned by ``get_solution(copy=False)``, see the updates.
         """
         current_loss = self.metrics_history['valid_loss'][-1]
         if (self.lowest_loss is None) or current_loss < self.lowest_loss:
             self.lowest_loss = current_loss
-            self.best_nets = deepcopy(self.nets)
-
-    def fit(self, max_epochs, callbacks=None, monitor=None):
+            source = self._best_nets_source
+            if (
+                self.best_nets is None
+                or source is None
+                or len(source) != len(self.nets)
+                or any(src is not net for src, net in zip(source, self.nets))
+            ):
+                self.best_nets = deepcopy(self.nets)
+                self._best_nets_source = list(self.nets)
+                return
+            # copy parameters into the existing snapshot instead of deep-copying the networks on every improvement
+            copied = set()
+            for best_net, net in zip(self.best_nets, self.nets):
+                if id(best_net) not in copied:
+                    best_net.load_state_dict(net.state_dict())
+                    copied.add(id(best_net))
+
+    def fit(self, max_epochs, callbacks=None, monitor=None, valid_every=1):
         r"""Run multiple epochs of training and validation, update best loss at the end of each epoch.
 
         If ``callbacks`` is passed, callbacks are run, one at a time,
@@ -350,6 +649,12 @@ class BaseSolver(ABC):
 
         :param max_epochs: Number of epochs to run.
         :type max_epochs: int
+        :param valid_every:
+            Run a validation epoch every ``valid_every`` epochs (and always on the first and last epoch).
+            On other epochs, the latest validation loss and metrics are repeated in history
+            (and ignored by callbacks such as ``neurodiffeq.callbacks.RepeatedMetricUp`` with ``use_train=False``).
+            Defaults to 1.
+        :type valid_every: int
         :param monitor:
             **[DEPRECATED]** use a MonitorCallback instance instead.
             The monitor for visualizing solution and metrics.
@@ -363,6 +668,9 @@ class BaseSolver(ABC):
             1. This method does not return solution, which is done in the ``.get_solution()`` method.
             2. A callback function `cb(solver)` can set ``solver._stop_training`` to True to perform early stopping.
         """
+        if valid_every < 1:
+            raise ValueError(f"valid_every must be a positive integer, got {valid_every}")
+
         self._stop_training = False
         self._max_local_epoch = max_epochs
 
@@ -378,7 +686,11 @@ class BaseSolver(ABC):
             # register local epoch so it can be accessed by callbacks
             self.local_epoch = local_epoch
             self.run_train_epoch()
-            self.run_valid_epoch()
+            # validation needs gradients w.r.t. coordinates, so skipping it is the only way to save the forward pass
+            if local_epoch % valid_every == 0 or local_epoch == max_epochs - 1:
+                self.run_valid_epoch()
+            else:
+                self._skip_valid_epoch()
 
             if callbacks:
                 for cb in callbacks:
@@ -405,6 +717,8 @@ class BaseSolver(ABC):
         :param copy:
             Whether to make a copy of the networks so that subsequent training doesn't affect the solution;
             Defaults to True.
+            Note that ``best_nets`` are updated in place whenever the validation loss improves,
+            so with ``copy=False`` even the best solution changes with subsequent training.
         :type copy: bool
         :param best:
             Whether to return the solution with lowest loss instead of the solution after the last epoch.
@@ -441,6 +755,9 @@ class BaseSolver(ABC):
             "n_funcs": self.n_funcs,
             "nets": self.nets,
             "optimizer": self.optimizer,
+            "distributed": self.distributed,
+            "jit": self.jit,
+            "precision": self.precision,
             "diff_eqs": self.diff_eqs,
             "generator": self.generator,
             "train_generator": self.generator['train'],
@@ -535,7 +852,14 @@ class BaseSolution(ABC):
         :return: Dependent variables evaluated at given points.
         :rtype: list[`torch.Tensor` or `numpy.array`] or `torch.Tensor` or `numpy.array`
         """
-        coords = [c if isinstance(c, torch.Tensor) else torch.tensor(c) for c in coords]
+        # avoid copying inputs when possible, but make sure they are on the same device as the networks
+        first_param = next(chain.from_iterable(n.parameters() for n in self.nets), None)
+        device = first_param.device if first_param is not None else None
+        coords = [
+            torch.as_tensor(c, device=device) if isinstance(c, torch.Tensor)
+            else torch.as_tensor(c, dtype=torch.get_default_dtype(), device=device)
+            for c in coords
+        ]
         original_shape = coords[0].shape
         coords = [c.reshape(-1, 1) for c in coords]
         if isinstance(to_numpy, str):
@@ -621,6 +945,21 @@ class SolverSpherical(BaseSolver):
         Ignored if ``nets`` is specified.
         Defaults to 1.
     :type n_output_units: int, optional
+    :param distributed:
+        Whether to train with data parallelism across all processes of the default ``torch.distributed`` group.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to False.
+    :type distributed: bool, optional
+    :param jit:
+        Whether to compile the networks with ``torch.jit.script`` for training.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to False.
+    :type jit: bool, optional
+    :param precision:
+        Precision of the forward pass during training and validation; one of 'fp32', 'bf16', or 'fp16'.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to 'fp32'.
+    :type precision: str, optional
     :param batch_size:
         **[DEPRECATED and IGNORED]**
         Each batch will use all samples generated.
@@ -635,7 +974,7 @@ class SolverSpherical(BaseSolver):
     def __init__(self, pde_system, conditions, r_min=None, r_max=None,
                  nets=None, train_generator=None, valid_generator=None, analytic_solutions=None,
                  optimizer=None, criterion=None, n_batches_train=1, n_batches_valid=4, enforcer=None,
-                 n_output_units=1,
+                 n_output_units=1, distributed=False, jit=False, precision='fp32',
                  # deprecated arguments are listed below
                  shuffle=None, batch_size=None):
 
@@ -667,6 +1006,9 @@ class SolverSpherical(BaseSolver):
             n_batches_valid=n_batches_valid,
             n_input_units=3,
             n_output_units=n_output_units,
+            distributed=distributed,
+            jit=jit,
+            precision=precision,
             shuffle=shuffle,
             batch_size=batch_size,
         )
@@ -718,6 +1060,8 @@ class SolverSpherical(BaseSolver):
         :param copy:
             Whether to make a copy of the networks so that subsequent training doesn't affect the solution;
             Defaults to True.
+            Note that ``best_nets`` are updated in place whenever the validation loss improves,
+            so with ``copy=False`` even the best solution changes with subsequent training.
         :type copy: bool
         :param best:
             Whether to return the solution with lowest loss instead of the solution after the last epoch.
@@ -855,6 +1199,21 @@ class Solver1D(BaseSolver):
         Ignored if ``nets`` is specified.
         Defaults to 1.
     :type n_output_units: int, optional
+    :param distributed:
+        Whether to train with data parallelism across all processes of the default ``torch.distributed`` group.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to False.
+    :type distributed: bool, optional
+    :param jit:
+        Whether to compile the networks with ``torch.jit.script`` for training.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to False.
+    :type jit: bool, optional
+    :param precision:
+        Precision of the forward pass during training and validation; one of 'fp32', 'bf16', or 'fp16'.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to 'fp32'.
+    :type precision: str, optional
     :param batch_size:
         **[DEPRECATED and IGNORED]**
         Each batch will use all samples generated.
@@ -869,6 +1228,7 @@ class Solver1D(BaseSolver):
     def __init__(self, ode_system, conditions, t_min, t_max,
                  nets=None, train_generator=None, valid_generator=None, analytic_solutions=None, optimizer=None,
                  criterion=None, n_batches_train=1, n_batches_valid=4, metrics=None, n_output_units=1,
+                 distributed=False, jit=False, precision='fp32',
                  # deprecated arguments are listed below
                  batch_size=None, shuffle=None):
 
@@ -899,6 +1259,9 @@ class Solver1D(BaseSolver):
             metrics=metrics,
             n_input_units=1,
             n_output_units=n_output_units,
+            distributed=distributed,
+            jit=jit,
+            precision=precision,
             shuffle=shuffle,
             batch_size=batch_size,
         )
@@ -915,6 +1278,8 @@ class Solver1D(BaseSolver):
         :param copy:
             Whether to make a copy of the networks so that subsequent training doesn't affect the solution;
             Defaults to True.
+            Note that ``best_nets`` are updated in place whenever the validation loss improves,
+            so with ``copy=False`` even the best solution changes with subsequent training.
         :type copy: bool
         :param best:
             Whether to return the solution with lowest loss instead of the solution after the last epoch.
@@ -1018,6 +1383,21 @@ class Solver2D(BaseSolver):
         Ignored if ``nets`` is specified.
         Defaults to 1.
     :type n_output_units: int, optional
+    :param distributed:
+        Whether to train with data parallelism across all processes of the default ``torch.distributed`` group.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to False.
+    :type distributed: bool, optional
+    :param jit:
+        Whether to compile the networks with ``torch.jit.script`` for training.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to False.
+    :type jit: bool, optional
+    :param precision:
+        Precision of the forward pass during training and validation; one of 'fp32', 'bf16', or 'fp16'.
+        See ``neurodiffeq.solvers.BaseSolver`` for details.
+        Defaults to 'fp32'.
+    :type precision: str, optional
     :param batch_size:
         **[DEPRECATED and IGNORED]**
         Each batch will use all samples generated.
@@ -1032,6 +1412,7 @@ class Solver2D(BaseSolver):
     def __init__(self, pde_system, conditions, xy_min, xy_max,
                  nets=None, train_generator=None, valid_generator=None, analytic_solutions=None, optimizer=None,
                  criterion=None, n_batches_train=1, n_batches_valid=4, metrics=None, n_output_units=1,
+                 distributed=False, jit=False, precision='fp32',
                  # deprecated arguments are listed below
                  batch_size=None, shuffle=None):
 
@@ -1062,6 +1443,9 @@ class Solver2D(BaseSolver):
             metrics=metrics,
             n_input_units=2,
             n_output_units=n_output_units,
+            distributed=distributed,
+            jit=jit,
+            precision=precision,
             shuffle=shuffle,
             batch_size=batch_size,
         )
@@ -1078,6 +1462,8 @@ class Solver2D(BaseSolver):
         :param copy:
             Whether to make a copy of the networks so that subsequent training doesn't affect the solution;
             Defaults to True.
+            Note that ``best_nets`` are updated in place whenever the validation loss improves,
+            so with ``copy=False`` even the best solution changes with subsequent training.
         :type copy: bool
         :param best:
             Whether to return the solution with lowest loss instead of the solution after the last epoch.
@@ -22,6 +22,13 @@ def _cartesian_prod_dims(x, t, x_grad=True, t_grad=True):
     tt.requires_grad = t_grad
     return xx, tt
 
+# convert a dict of scalar tensors to a dict of floats, with a single device-to-host copy.
+def _tensors_to_floats(tensors):
+    if not tensors:
+        return {}
+    values = torch.stack([v.detach().reshape(()).to(torch.float64) for v in tensors.values()]).tolist()
+    return dict(zip(tensors, values))
+
 class Approximator(ABC):
     """The base class of approximators. An approximator is an approximation of the differential equation's solution.
     It knows the parameters in the neural network, and how to calculate the loss function and the metrics.
@@ -199,10 +206,9 @@ class SingleNetworkApproximator2DSpatialSystem(Approximator):
     def calculate_loss(self, xx, yy):
         uu = self.__call__(xx, yy)
 
-        equation_mse = sum(
-            torch.mean(eq**2)
-            for eq in self.pde(*uu, xx, yy)
-        )
+        # stack residuals of all equations so that the sum of their MSEs is computed in a single reduction
+        residuals = torch.stack(self.pde(*uu, xx, yy))
+        equation_mse = torch.sum(torch.mean(residuals.reshape(len(residuals), -1) ** 2, dim=1))
 
         boundary_mse = self.boundary_strictness * sum(self._boundary_mse(bc) for bc in self.boundary_conditions)
 
@@ -937,15 +943,14 @@ def _train_1dspatial_temporal(train_generator_spatial, train_generator_temporal,
     t = next(train_generator_temporal)
     xx, tt = _cartesian_prod_dims(x, t)
     training_set_size = len(xx)
-    idx = torch.randperm(training_set_size) if shuffle else torch.arange(training_set_size)
+    # create indices on the same device as the training set to avoid a host-to-device copy for every batch
+    idx = torch.randperm(training_set_size, device=xx.device) if shuffle \
+        else torch.arange(training_set_size, device=xx.device)
 
-    batch_start, batch_end = 0, batch_size
-    while batch_start < training_set_size:
-        if batch_end > training_set_size:
-            batch_end = training_set_size
-        batch_idx = idx[batch_start:batch_end]
-        batch_xx = xx[batch_idx]
-        batch_tt = tt[batch_idx]
+    epoch_loss = 0.0
+    for batch_idx in idx.split(batch_size):
+        batch_xx = xx.index_select(0, batch_idx)
+        batch_tt = tt.index_select(0, batch_idx)
 
         batch_loss = approximator.calculate_loss(batch_xx, batch_tt, x, t)
 
@@ -953,14 +958,12 @@ def _train_1dspatial_temporal(train_generator_spatial, train_generator_temporal,
         batch_loss.backward()
         optimizer.step()
 
-        batch_start += batch_size
-        batch_end += batch_size
+        # weighted by batch size, so that the epoch loss is the average over all training points
+        epoch_loss += batch_loss.detach() * len(batch_idx)
 
-    epoch_loss = approximator.calculate_loss(xx, tt, x, t).item()
+    epoch_loss = epoch_loss.item() / training_set_size
 
-    epoch_metrics = approximator.calculate_metrics(xx, tt, x, t, metrics)
-    for k, v in epoch_metrics.items():
-        epoch_metrics[k] = v.item()
+    epoch_metrics = _tensors_to_floats(approximator.calculate_metrics(xx, tt, x, t, metrics))
 
     return epoch_loss, epoch_metrics
 
@@ -972,15 +975,14 @@ def _train_2dspatial(train_generator_spatial, train_generator_temporal,
     xx.requires_grad = True
     yy.requires_grad = True
     training_set_size = len(xx)
-    idx = torch.randperm(training_set_size) if shuffle else torch.arange(training_set_size)
+    # create indices on the same device as the training set to avoid a host-to-device copy for every batch
+    idx = torch.randperm(training_set_size, device=xx.device) if shuffle \
+        else torch.arange(training_set_size, device=xx.device)
 
-    batch_start, batch_end = 0, batch_size
-    while batch_start < training_set_size:
-        if batch_end > training_set_size:
-            batch_end = training_set_size
-        batch_idx = idx[batch_start:batch_end]
-        batch_xx = xx[batch_idx]
-        batch_yy = yy[batch_idx]
+    epoch_loss = 0.0
+    for batch_idx in idx.split(batch_size):
+        batch_xx = xx.index_select(0, batch_idx)
+        batch_yy = yy.index_select(0, batch_idx)
 
         batch_loss = approximator.calculate_loss(batch_xx, batch_yy)
 
@@ -988,14 +990,12 @@ def _train_2dspatial(train_generator_spatial, train_generator_temporal,
         batch_loss.backward()
         optimizer.step()
 
-        batch_start += batch_size
-        batch_end += batch_size
+        # weighted by batch size, so that the epoch loss is the average over all training points
+        epoch_loss += batch_loss.detach() * len(batch_idx)
 
-    epoch_loss = approximator.calculate_loss(xx, yy).item()
+    epoch_loss = epoch_loss.item() / training_set_size
 
-    epoch_metrics = approximator.calculate_metrics(xx, yy, metrics)
-    for k, v in epoch_metrics.items():
-        epoch_metrics[k] = v.item()
+    epoch_metrics = _tensors_to_floats(approximator.calculate_metrics(xx, yy, metrics))
 
     return epoch_loss, epoch_metrics
 
@@ -1008,9 +1008,7 @@ def _valid_2dspatial(valid_generator_spatial, valid_generator_temporal, approxim
 
     epoch_loss = approximator.calculate_loss(xx, yy).item()
 
-    epoch_metrics = approximator.calculate_metrics(xx, yy, metrics)
-    for k, v in epoch_metrics.items():
-        epoch_metrics[k] = v.item()
+    epoch_metrics = _tensors_to_floats(approximator.calculate_metrics(xx, yy, metrics))
 
     return epoch_loss, epoch_metrics
 
@@ -1023,16 +1021,15 @@ def _train_2dspatial_temporal(train_generator_spatial, train_generator_temporal,
     xx, tt = _cartesian_prod_dims(x, t)
     yy, tt = _cartesian_prod_dims(y, t)
     training_set_size = len(xx)
-    idx = torch.randperm(training_set_size) if shuffle else torch.arange(training_set_size)
+    # create indices on the same device as the training set to avoid a host-to-device copy for every batch
+    idx = torch.randperm(training_set_size, device=xx.device) if shuffle \
+        else torch.arange(training_set_size, device=xx.device)
 
-    batch_start, batch_end = 0, batch_size
-    while batch_start < training_set_size:
-        if batch_end > training_set_size:
-            batch_end = training_set_size
-        batch_idx = idx[batch_start:batch_end]
-        batch_xx = xx[batch_idx]
-        batch_yy = yy[batch_idx]
-        batch_tt = tt[batch_idx]
+    epoch_loss = 0.0
+    for batch_idx in idx.split(batch_size):
+        batch_xx = xx.index_select(0, batch_idx)
+        batch_yy = yy.index_select(0, batch_idx)
+        batch_tt = tt.index_select(0, batch_idx)
 
         batch_loss = approximator.calculate_loss(batch_xx, batch_yy, batch_tt, x, y, t)
 
@@ -1040,15 +1037,12 @@ def _train_2dspatial_temporal(train_generator_spatial, train_generator_temporal,
         batch_loss.backward()
         optimizer.step()
 
-        batch_start += batch_size
-        batch_end += batch_size
+        # weighted by batch size, so that the epoch loss is the average over all training points
+        epoch_loss += batch_loss.detach() * len(batch_idx)
 
-    # TODO: this can give us the real loss after an epoch, but can be very memory intensive
-    epoch_loss = approximator.calculate_loss(xx, yy, tt, x, y, t).item()
+    epoch_loss = epoch_loss.item() / training_set_size
 
-    epoch_metrics = approximator.calculate_metrics(xx, yy, tt, x, y, t, metrics)
-    for k, v in epoch_metrics.items():
-        epoch_metrics[k] = v.item()
+    epoch_metrics = _tensors_to_floats(approximator.calculate_metrics(xx, yy, tt, x, y, t, metrics))
 
     return epoch_loss, epoch_metrics
 
@@ -1061,9 +1055,7 @@ def _valid_1dspatial_temporal(valid_generator_spatial, valid_generator_temporal,
 
     epoch_loss = approximator.calculate_loss(xx, tt, x, t).item()
 
-    epoch_metrics = approximator.calculate_metrics(xx, tt, x, t, metrics)
-    for k, v in epoch_metrics.items():
-        epoch_metrics[k] = v.item()
+    epoch_metrics = _tensors_to_floats(approximator.calculate_metrics(xx, tt, x, t, metrics))
 
     return epoch_loss, epoch_metrics
 
@@ -1077,8 +1069,6 @@ def _valid_2dspatial_temporal(valid_generator_spatial, valid_generator_temporal,
 
     epoch_loss = approximator.calculate_loss(xx, yy, tt, x, y, t).item()
 
-    epoch_metrics = approximator.calculate_metrics(xx, yy, tt, x, y, t, metrics)
-    for k, v in epoch_metrics.items():
-        epoch_metrics[k] = v.item()
+    epoch_metrics = _tensors_to_floats(approximator.calculate_metrics(xx, yy, tt, x, y, t, metrics))
 
     return epoch_loss, epoch_metrics
@@ -35,5 +35,26 @@ def set_tensor_type(device=None, float_bits=32):
     torch.set_default_tensor_type(type_string)
 
 
+def set_matmul_precision(precision="high"):
+    """Set the internal precision of float32 matrix multiplications, e.g., those in ``torch.nn.Linear`` layers.
+
+    :param precision:
+        One of "highest", "high", or "medium"; defaults to "high".
+
+        - "highest" uses full float32 precision.
+        - "high" allows TensorFloat32 tensor cores (Ampere GPUs or newer).
+        - "medium" allows bfloat16 tensor cores.
+    :type precision: str
+
+    .. note:
+        The function calls ``torch.set_float32_matmul_precision`` under the hood and only affects float32 tensors.
+        Since neurodiffeq uses 64-bit floats by default, call ``set_tensor_type(float_bits=32)`` for it to take effect.
+    """
+    if precision not in ["highest", "high", "medium"]:
+        raise ValueError(f"Unknown precision '{precision}'; precision must be 'highest', 'high', or 'medium'")
+
+    torch.set_float32_matmul_precision(precision)
+
+
 def safe_mkdir(path):
     Path(path).mkdir(parents=True, exist_ok=True)
@@ -301,6 +301,14 @@ def test_repeated_diverge(solver):
             assert not callback.condition(solver)
 
 
+def test_repeated_metric_skipped_validation(solver):
+    for callback in [RepeatedMetricUp(use_train=False), RepeatedMetricConverge(epsilon=1e-12, use_train=False)]:
+        callback.set_action_callback(StopCallback())
+        solver.fit(max_epochs=20, callbacks=[callback], valid_every=10)
+        # repeated validation values on skipped epochs are not considered as a change
+        assert solver.local_epoch == 19
+
+
 def test_eve_callback(solver):
     BASE_VALUE = 1000.0
     DOUBLE_AT = 0.5
@@ -1,5 +1,7 @@
 import numpy as np
+from contextlib import contextmanager
 from numpy import isclose
+import pytest
 from pytest import raises, warns
 from scipy.integrate import odeint
 import matplotlib
@@ -9,10 +11,12 @@ matplotlib.use('Agg')  # use a non-GUI backend, so plots are not shown during te
 from neurodiffeq.neurodiffeq import safe_diff as diff
 from neurodiffeq.networks import FCNN, SinActv
 from neurodiffeq.ode import IVP, DirichletBVP
+from neurodiffeq.conditions import NoCondition
 from neurodiffeq.ode import solve, solve_system, Monitor
 from neurodiffeq.monitors import Monitor1D
 from neurodiffeq.solvers import Solution1D, Solver1D
 from neurodiffeq.generators import Generator1D, BaseGenerator
+from neurodiffeq.utils import set_tensor_type
 
 import torch
 
@@ -20,6 +24,29 @@ torch.manual_seed(42)
 np.random.seed(42)
 
 
+def _exponential_solver(**kwargs):
+    # solver for u' = u with u(0) = 1 on [0, 2], keyword arguments are passed to `Solver1D`
+    return Solver1D(
+        ode_system=lambda u, t: [diff(u, t) - u],
+        conditions=[IVP(t_0=0.0, u_0=1.0)],
+        t_min=0.0,
+        t_max=2.0,
+        **kwargs
+    )
+
+
+@contextmanager
+def _float32_cpu_tensor_type():
+    # autocast only affects float32 tensors, the original default dtype and device are restored afterwards
+    device = torch.empty(0).device.type
+    float_bits = 64 if torch.get_default_dtype() == torch.float64 else 32
+    set_tensor_type('cpu', float_bits=32)
+    try:
+        yield
+    finally:
+        set_tensor_type(device, float_bits=float_bits)
+
+
 def test_monitor():
     exponential = lambda u, t: diff(u, t) - u
     init_val_ex = IVP(t_0=0.0, u_0=1.0)
@@ -191,6 +218,12 @@ def test_solution():
         us = solution(ts, as_type='np')
         check_output(us, shape=(N_SAMPLES, 1), type=np.ndarray, msg=f"[use_single={use_single}]")
 
+        ts = ts.detach().cpu().numpy()
+        us = solution(ts)
+        check_output(us, shape=(N_SAMPLES, 1), type=torch.Tensor, msg=f"[use_single={use_single}]")
+        us = solution(ts.tolist(), as_type='np')
+        check_output(us, shape=(N_SAMPLES, 1), type=np.ndarray, msg=f"[use_single={use_single}]")
+
 
 def test_get_internals():
     parametric_circle = lambda x1, x2, t: [diff(x1, t) - x2, diff(x2, t) + x1]
@@ -220,3 +253,276 @@ def test_get_internals():
     assert isinstance(internals, list)
     internals = solver.get_internals('train_generator')
     assert isinstance(internals, BaseGenerator)
+
+
+def test_fit_valid_every():
+    solver = _exponential_solver(metrics={'u_mean': lambda u, t: u.mean()})
+
+    solver.fit(max_epochs=6, valid_every=4)
+    for key in ['valid_loss', 'valid__u_mean']:
+        history = solver.metrics_history[key]
+        assert len(history) == 6
+        # validation is only run on epochs 0, 4 and 5 (last epoch)
+        assert history[0] == history[1] == history[2] == history[3]
+        assert history[3] != history[4] != history[5]
+
+    with raises(ValueError):
+        solver.fit(max_epochs=1, valid_every=0)
+
+
+def test_compute_funcs_single_net():
+    conditions_list = [
+        ([IVP(t_0=0.0, u_0=0.0), IVP(t_0=0.0, u_0=1.0)], True),
+        ([IVP(t_0=0.0, u_0=0.0, u_0_prime=1.0), IVP(t_0=0.5, u_0=1.0, u_0_prime=0.0)], True),
+        ([DirichletBVP(t_0=0.0, u_0=0.0, t_1=2.0, u_1=1.0), DirichletBVP(t_0=0.5, u_0=1.0, t_1=1.5, u_1=0.0)], True),
+        ([NoCondition(), NoCondition()], True),
+        ([IVP(t_0=0.0, u_0=0.0), IVP(t_0=0.0, u_0=1.0, u_0_prime=1.0)], False),
+        ([IVP(t_0=0.0, u_0=0.0), DirichletBVP(t_0=0.0, u_0=0.0, t_1=2.0, u_1=1.0)], False),
+    ]
+
+    for conditions, stacked in conditions_list:
+        net = FCNN(1, 2)
+        for i, cond in enumerate(conditions):
+            cond.set_impose_on(i)
+        solver = Solver1D(
+            ode_system=lambda u1, u2, t: [diff(u1, t) - u2, diff(u2, t) + u1],
+            conditions=conditions,
+            t_min=0.0,
+            t_max=2.0,
+            nets=[net, net],
+        )
+        assert solver._stacked == stacked
+
+        n_calls = 0
+
+        def count_calls(module, inputs, output):
+            nonlocal n_calls
+            n_calls += 1
+
+        net.register_forward_hook(count_calls)
+        ts = torch.linspace(0, 2, 10, requires_grad=True).reshape(-1, 1)
+        funcs = solver._compute_funcs([ts])
+        assert n_calls == 1
+        for u, cond in zip(funcs, conditions):
+            assert u.shape == (10, 1)
+            assert torch.allclose(u, cond.enforce(net, ts))
+
+
+def test_compute_funcs_stacked_conditions():
+    def make_solver(conditions, **kwargs):
+        net = FCNN(1, 2)
+        for i, cond in enumerate(conditions):
+            cond.set_impose_on(i)
+        return Solver1D(
+            ode_system=lambda u1, u2, t: [diff(u1, t) - u2, diff(u2, t) + u1],
+            conditions=conditions,
+            t_min=0.0,
+            t_max=2.0,
+            nets=[net, net],
+            **kwargs
+        )
+
+    # modified conditions are taken into account
+    conditions = [IVP(t_0=0.0, u_0=0.0), IVP(t_0=0.0, u_0=1.0)]
+    solver = make_solver(conditions)
+    t_0 = torch.zeros(1, 1, requires_grad=True)
+    assert solver._stacked
+    assert [u.item() for u in solver._compute_funcs([t_0])] == [0.0, 1.0]
+    conditions[1].u_0 = 5.0
+    assert [u.item() for u in solver._compute_funcs([t_0])] == [0.0, 5.0]
+    conditions[1].u_0_prime = 1.0
+    assert not solver._stacked
+    assert [u.item() for u in solver._compute_funcs([t_0])] == [0.0, 5.0]
+
+    # conditions are enforced in the precision of inputs under autocast
+    with _float32_cpu_tensor_type():
+        solver = make_solver([IVP(t_0=0.1, u_0=1.01), IVP(t_0=0.1, u_0=2.03)], precision='bf16')
+        t_0 = torch.full((1, 1), 0.1, requires_grad=True)
+        with solver._autocast():
+            funcs = solver._compute_funcs([t_0])
+        assert [u.item() for u in funcs] == [torch.tensor(1.01).item(), torch.tensor(2.03).item()]
+
+
+def test_update_best():
+    net = FCNN(1, 1)
+    solver = _exponential_solver(nets=[net])
+    solver.fit(max_epochs=1)
+    best_nets = solver.best_nets
+    assert best_nets[0] is not net
+
+    with torch.no_grad():
+        for p in net.parameters():
+            p.add_(1.0)
+    solver.lowest_loss = float('inf')
+    solver.run_valid_epoch()
+    assert solver.best_nets is best_nets
+    for p_best, p in zip(best_nets[0].parameters(), net.parameters()):
+        assert p_best is not p
+        assert torch.equal(p_best, p)
+
+    # reassigning `solver.nets` creates a new snapshot, even if the number of networks is unchanged
+    for nets in [[FCNN(1, 1, hidden_units=(8,))], [FCNN(1, 2)] * 2, [FCNN(1, 1), FCNN(1, 1)]]:
+        solver.nets = nets
+        solver.lowest_loss = float('inf')
+        solver._update_best()
+        assert solver.best_nets is not best_nets
+        assert len(solver.best_nets) == len(nets)
+        for best_net, net in zip(solver.best_nets, nets):
+            assert best_net is not net
+            for p_best, p in zip(best_net.parameters(), net.parameters()):
+                assert torch.equal(p_best, p)
+        assert (solver.best_nets[0] is solver.best_nets[-1]) == (nets[0] is nets[-1])
+        best_nets = solver.best_nets
+
+
+def test_distributed(tmp_path):
+    with raises(ValueError):
+        _exponential_solver(distributed=True)
+
+    torch.distributed.init_process_group('gloo', init_method=f'file://{tmp_path / "store"}', rank=0, world_size=1)
+    try:
+        solver = _exponential_solver(metrics={'u_mean': lambda u, t: u.mean()}, distributed=True)
+        solver.fit(max_epochs=3)
+        assert solver.get_internals('distributed')
+        for key in ['train_loss', 'valid_loss', 'train__u_mean', 'valid__u_mean']:
+            assert len(solver.metrics_history[key]) == 3
+    finally:
+        torch.distributed.destroy_process_group()
+
+
+def _distributed_worker(rank, world_size, tmp_path, lbfgs):
+    torch.distributed.init_process_group(
+        'gloo', init_method=f'file://{tmp_path / "store"}', rank=rank, world_size=world_size,
+    )
+    try:
+        # different initial parameters and batches on each process
+        torch.manual_seed(rank)
+        net = FCNN(1, 1)
+        optimizer = torch.optim.LBFGS(net.parameters(), line_search_fn='strong_wolfe') if lbfgs else None
+        solver = _exponential_solver(
+            nets=[net],
+            optimizer=optimizer,
+            metrics={'rank': lambda u, t: torch.tensor(float(rank))},
+            distributed=True,
+        )
+        solver.fit(max_epochs=3)
+        torch.save(
+            {'params': [p.detach() for p in solver.nets[0].parameters()], 'history': solver.metrics_history},
+            tmp_path / f'{rank}.pt',
+        )
+    finally:
+        torch.distributed.destroy_process_group()
+
+
+@pytest.mark.parametrize('lbfgs', [False, True])
+def test_distributed_multiprocess(tmp_path, lbfgs):
+    world_size = 2
+    # closure-based optimizers (LBFGS) must call the closure the same number of times on all processes
+    torch.multiprocessing.spawn(_distributed_worker, args=(world_size, tmp_path, lbfgs), nprocs=world_size)
+    results = [torch.load(tmp_path / f'{rank}.pt') for rank in range(world_size)]
+
+    # gradients are averaged, so parameters stay in sync
+    for p0, p1 in zip(results[0]['params'], results[1]['params']):
+        assert torch.equal(p0, p1)
+    # losses and metrics are averaged across processes
+    assert results[0]['history'] == results[1]['history']
+    # LBFGS calls the closure several times per step, which accumulates training metrics several times
+    for key in ['valid__rank'] if lbfgs else ['train__rank', 'valid__rank']:
+        assert results[0]['history'][key] == [0.5] * 3
+
+
+def test_loss_criterion():
+    for criterion in [torch.nn.MSELoss(), torch.nn.L1Loss(), torch.nn.SmoothL1Loss()]:
+        solver = _exponential_solver(criterion=criterion)
+        for n_samples in [10, 10, 20]:
+            r = torch.rand(n_samples, 2)
+            assert torch.isclose(solver.criterion(r), criterion(r, torch.zeros_like(r)))
+
+
+def test_jit():
+    class UnscriptableNet(torch.nn.Module):
+        def __init__(self):
+            super(UnscriptableNet, self).__init__()
+            self.linear = torch.nn.Linear(1, 1)
+            self.actv = lambda x: torch.tanh(x)
+
+        def forward(self, t):
+            return self.actv(self.linear(t))
+
+    net = FCNN(1, 1)
+    solver = _exponential_solver(nets=[net], jit=True)
+    assert isinstance(solver._forward_nets[0], torch.jit.ScriptModule)
+    assert solver._forward_nets[0] is solver._forward_nets[0]
+    assert solver.nets[0] is net
+    # scripted networks share parameters with the original networks
+    for p_scripted, p in zip(solver._forward_nets[0].parameters(), net.parameters()):
+        assert p_scripted.data_ptr() == p.data_ptr()
+    params_before = [p.detach().clone() for p in net.parameters()]
+    solver.fit(max_epochs=2)
+    assert not all(torch.equal(p0, p) for p0, p in zip(params_before, net.parameters()))
+    assert isinstance(solver.get_solution(), Solution1D)
+
+    # reassigning `solver.nets` changes the networks being trained
+    new_net = FCNN(1, 1)
+    solver.nets = [new_net]
+    solver.optimizer = torch.optim.Adam(new_net.parameters())
+    params_before = [p.detach().clone() for p in new_net.parameters()]
+    solver.fit(max_epochs=2)
+    assert not all(torch.equal(p0, p) for p0, p in zip(params_before, new_net.parameters()))
+
+    with warns(UserWarning):
+        solver = _exponential_solver(nets=[UnscriptableNet()], jit=True)
+    assert solver._forward_nets[0] is solver.nets[0]
+    solver.fit(max_epochs=2)
+
+    solver = _exponential_solver(nets=[net], jit=False)
+    assert solver._forward_nets[0] is net
+    solver.nets = [new_net]
+    assert solver._forward_nets[0] is new_net
+
+
+def test_precision():
+    with raises(ValueError):
+        _exponential_solver(precision='fp64')
+    with raises(ValueError):
+        net = FCNN(1, 1)
+        _exponential_solver(nets=[net], optimizer=torch.optim.LBFGS(net.parameters()), precision='fp16')
+
+    with _float32_cpu_tensor_type():
+        for precision in ['fp32', 'bf16', 'fp16']:
+            solver = _exponential_solver(metrics={'u_mean': lambda u, t: u.mean()}, precision=precision)
+            solver.fit(max_epochs=2)
+            assert solver.get_internals('precision') == precision
+            assert all(np.isfinite(solver.metrics_history['train_loss']))
+            assert (solver._grad_scaler is not None) == (precision == 'fp16')
+
+        # with 'fp32', autocast enabled by the caller is not turned off
+        is_autocast_enabled = []
+
+        def check_autocast(module, inputs, output):
+            is_autocast_enabled.append(torch.is_autocast_enabled('cpu'))
+
+        net = FCNN(1, 1)
+        net.register_forward_hook(check_autocast)
+        solver = _exponential_solver(nets=[net])
+        with torch.autocast('cpu', dtype=torch.bfloat16):
+            solver.fit(max_epochs=1)
+        assert is_autocast_enabled and all(is_autocast_enabled)
+
+
+def test_default_optimizer_single_net():
+    net = FCNN(1, 2)
+    solver = Solver1D(
+        ode_system=lambda u1, u2, t: [diff(u1, t) - u2, diff(u2, t) + u1],
+        conditions=[IVP(t_0=0.0, u_0=0.0), IVP(t_0=0.0, u_0=1.0)],
+        t_min=0.0,
+        t_max=2.0,
+        nets=[net, net],
+    )
+    params = [p for group in solver.optimizer.param_groups for p in group['params']]
+    assert len(params) == len(list(net.parameters()))
+    # the fused implementation is used on CUDA, the multi-tensor (foreach) implementation otherwise
+    if solver._device_type == 'cuda':
+        assert solver.optimizer.defaults['fused']
+    else:
+        assert solver.optimizer.defaults['foreach']
@@ -0,0 +1,19 @@
+import torch
+from pytest import raises
+
+from neurodiffeq.utils import set_matmul_precision
+
+
+def test_set_matmul_precision():
+    original_precision = torch.get_float32_matmul_precision()
+    try:
+        for precision in ['highest', 'high', 'medium']:
+            set_matmul_precision(precision)
+            assert torch.get_float32_matmul_precision() == precision
+        set_matmul_precision()
+        assert torch.get_float32_matmul_precision() == 'high'
+
+        with raises(ValueError):
+            set_matmul_precision('low')
+    finally:
+        torch.set_float32_matmul_precision(original_precision)